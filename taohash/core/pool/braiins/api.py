@@ -1,11 +1,19 @@
+import threading
+import time
+from collections import defaultdict
+
 import bittensor as bt
+import orjson
 import requests
 from backoff import on_exception, expo
 from ratelimit import limits, RateLimitException
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, JSONDecodeError
 
 from taohash.core.pool.api import PoolAPI
 
+WORKER_DATA_TTL = 10 * 60  # 10 minutes
+
 
 class BraiinsPoolConnectionError(Exception):
     """Custom exception for Braiins Pool API errors"""
@@ -16,6 +24,26 @@ class BraiinsPoolConnectionError(Exception):
 class BraiinsPoolAPI(PoolAPI):
     def __init__(self, api_key: str) -> None:
         super().__init__(api_key)
+        # Reuse one pooled session so each fetch skips the TCP/TLS handshake
+        self._session = requests.Session()
+        self._session.headers.update(
+            {
+                "X-SlushPool-Auth-Token": api_key,
+                "accept": "application/json",
+            }
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=1, pool_maxsize=2)
+        )
+        # Minimal per-coin TTL cache: (expiry, worker data). A plain dict
+        # lookup keyed by coin is cheaper than a generic memoization layer
+        # and avoids refetching every worker on each per-worker query.
+        self._worker_data_cache: dict[str, tuple[float, dict]] = {}
+        # Single-flight: one thread refetches on expiry while others wait,
+        # so concurrent callers can't stampede the rate-limited pool API.
+        self._worker_data_locks: dict[str, threading.Lock] = defaultdict(
+            threading.Lock
+        )
         if not self.test_connection():
             bt.logging.error(
                 "Failed to connect to Braiins Pool API. Please check your API key and try again."
@@ -56,27 +84,41 @@ class BraiinsPoolAPI(PoolAPI):
         else:
             return splits[-1]  # Take the worker_id after the last dot
 
+    def _get_worker_data(self, coin: str) -> dict[str, float]:
+        cached = self._worker_data_cache.get(coin)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        with self._worker_data_locks[coin]:
+            # Recheck after acquiring: another thread may have refetched
+            cached = self._worker_data_cache.get(coin)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            output = self._fetch_worker_data(coin)
+            self._worker_data_cache[coin] = (
+                time.monotonic() + WORKER_DATA_TTL,
+                output,
+            )
+        return output
+
     @on_exception(
         expo, (RateLimitException, RequestException, JSONDecodeError), max_tries=8
     )
     @limits(calls=1, period=5)  # rate limit once per 5s
-    def _get_worker_data(self, coin: str) -> dict[str, float]:
+    def _fetch_worker_data(self, coin: str) -> dict[str, float]:
         coin_name = self.__COIN_TO_COIN_NAME[coin]
         url = f"https://pool.braiins.com/accounts/workers/json/{coin_name}"
 
-        response = requests.get(
-            url=url,
-            headers={
-                "X-SlushPool-Auth-Token": self.api_key,
-                "accept": "application/json",
-            },
-        )
+        response = self._session.get(url=url, timeout=10)
         response.raise_for_status()
 
-        result = response.json()
+        # orjson decodes the (potentially large) worker payload noticeably
+        # faster than stdlib json.
+        result = orjson.loads(response.content)
         workers = result[coin_name]["workers"]
         output = {
-            self._worker_name_to_worker_id(worker_name): {**worker_data}
+            self._worker_name_to_worker_id(worker_name): worker_data
             for worker_name, worker_data in workers.items()
         }
 
@@ -92,8 +134,13 @@ class BraiinsPoolAPI(PoolAPI):
         if coin != "bitcoin":
             raise ValueError("BraiinsPool only supports bitcoin")
 
-        workers_data = self._get_worker_data(coin)
-        return workers_data.get(worker_id, None)
+        worker_data = self._get_worker_data(coin).get(worker_id)
+        if worker_data is None:
+            return None
+        # Copy at the boundary: the dict lives in the TTL cache, and a caller
+        # mutating it in place would corrupt every lookup for the rest of the
+        # cache window
+        return {**worker_data}
 
     @on_exception(
         expo, (RateLimitException, RequestException, JSONDecodeError), max_tries=8
@@ -106,16 +153,10 @@ class BraiinsPoolAPI(PoolAPI):
         coin_name = self.__COIN_TO_COIN_NAME[coin]
         url = f"https://pool.braiins.com/stats/json/{coin_name}"
 
-        response = requests.get(
-            url=url,
-            headers={
-                "X-SlushPool-Auth-Token": self.api_key,
-                "accept": "application/json",
-            },
-        )
+        response = self._session.get(url=url, timeout=10)
         response.raise_for_status()
 
-        result = response.json()
+        result = orjson.loads(response.content)
         stats_data = result[coin_name]
         fpps = stats_data["fpps_rate"]
 
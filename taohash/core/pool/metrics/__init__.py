@@ -4,7 +4,13 @@ Pool metrics module for tracking miner performance.
 
 from .base import BaseMetrics
 from .braiins import BraiinsMetrics, get_metrics_for_miners
-from .taohash_proxy import ProxyMetrics, get_metrics_timerange
+from .taohash_proxy import (
+    ProxyMetrics,
+    get_metrics_timerange,
+    get_metrics_timerange_arrays,
+    map_hotkeys_to_workers,
+    share_values_to_fiat,
+)
 from .evaluation import EvaluationMetrics
 
 __all__ = [
@@ -14,4 +20,7 @@ __all__ = [
     "EvaluationMetrics",
     "get_metrics_for_miners",
     "get_metrics_timerange",
+    "get_metrics_timerange_arrays",
+    "map_hotkeys_to_workers",
+    "share_values_to_fiat",
 ]
@@ -6,13 +6,15 @@ from abc import ABC
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseMetrics(ABC):
     """
     Abstract base class for mining metrics.
     All pool-specific metrics should inherit from this class.
+
+    Metrics are instantiated once per miner per evaluation, so slotted
+    dataclasses are used to avoid the per-instance ``__dict__`` overhead.
     """
-    
+
     hotkey: str
     hash_rate_unit: str = "Gh/s"
-    
\ No newline at end of file
@@ -8,7 +8,7 @@ from taohash.core.pool.pool import PoolBase
 from .base import BaseMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class BraiinsMetrics(BaseMetrics):
     """
     Mining Metrics for Braiins pool.
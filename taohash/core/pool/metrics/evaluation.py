@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass
 from typing import Optional, Any
+
+import numpy as np
 from bittensor import logging
 from taohash.core.constants import PAYOUT_FACTOR
 
@@ -12,7 +14,8 @@ class EvaluationMetrics:
     Tracks evaluation metrics for a specific mining coin.
 
     Manages scores, payout factors, and timestamps for each evaluated coin
-    by the validator.
+    by the validator. Scores are kept as a NumPy array so accumulation and
+    weighting are vectorized instead of looping per UID in Python.
 
     Attributes:
         coin: Coin identifier (e.g., 'btc', 'bch')
@@ -22,7 +25,7 @@ class EvaluationMetrics:
     """
 
     coin: str
-    scores: list[float]
+    scores: np.ndarray
     payout_factor: float = PAYOUT_FACTOR
     last_evaluation_timestamp: Optional[int] = None
 
@@ -35,7 +38,7 @@ class EvaluationMetrics:
             num_hotkeys: Number of hotkeys/UIDs to track
         """
         self.coin = coin
-        self.scores = [0.0] * num_hotkeys
+        self.scores = np.zeros(num_hotkeys, dtype=np.float64)
         self.payout_factor = PAYOUT_FACTOR
         self.last_evaluation_timestamp = None
 
@@ -46,7 +49,10 @@ class EvaluationMetrics:
         Args:
             num_hotkeys: Number of hotkeys/UIDs to track
         """
-        self.scores = [0.0] * num_hotkeys
+        if self.scores.size != num_hotkeys:
+            self.scores = np.zeros(num_hotkeys, dtype=np.float64)
+        else:
+            self.scores.fill(0.0)
 
     def add_score(self, uid: int, value: float) -> None:
         """
@@ -56,21 +62,40 @@ class EvaluationMetrics:
             uid: Unique identifier for the miner
             value: Score value to add
         """
-        if 0 <= uid < len(self.scores):
+        if 0 <= uid < self.scores.size:
             self.scores[uid] += value
         else:
             logging.error(
                 f"Invalid UID: {uid} for coin: {self.coin}. Out of sync metagraph."
             )
 
-    def get_weighted_scores(self) -> list[float]:
+    def add_scores(self, uids: np.ndarray, values: np.ndarray) -> None:
+        """
+        Add to multiple miners' scores in one vectorized update.
+
+        Args:
+            uids: UIDs of the miners to update
+            values: Score values to add, aligned with `uids`
+        """
+        if uids.size == 0:
+            return
+        valid = (uids >= 0) & (uids < self.scores.size)
+        if not valid.all():
+            logging.error(
+                f"Invalid UIDs: {uids[~valid].tolist()} for coin: {self.coin}. "
+                f"Out of sync metagraph."
+            )
+            uids, values = uids[valid], values[valid]
+        np.add.at(self.scores, uids, values)
+
+    def get_weighted_scores(self) -> np.ndarray:
         """
         Get scores with payout factor applied.
 
         Returns:
-            list of scores multiplied by the payout factor
+            Array of scores multiplied by the payout factor
         """
-        return [score * self.payout_factor for score in self.scores]
+        return self.scores * self.payout_factor
 
     def get_total_weighted_score(self) -> float:
         """
@@ -79,7 +104,7 @@ class EvaluationMetrics:
         Returns:
             Total of all scores multiplied by payout factor
         """
-        return sum(self.get_weighted_scores())
+        return float(self.scores.sum() * self.payout_factor)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -89,7 +114,7 @@ class EvaluationMetrics:
             dictionary representation of the metrics
         """
         return {
-            "scores": self.scores,
+            "scores": self.scores.tolist(),
             "payout_factor": self.payout_factor,
             "last_evaluation_timestamp": self.last_evaluation_timestamp,
         }
@@ -110,7 +135,10 @@ class EvaluationMetrics:
             EvaluationMetrics instance restored from saved data
         """
         metrics = cls(coin, num_hotkeys)
-        metrics.scores = data.get("scores", [])
+        scores = np.asarray(data.get("scores", []), dtype=np.float64)
+        if scores.size < num_hotkeys:
+            scores = np.pad(scores, (0, num_hotkeys - scores.size))
+        metrics.scores = scores
         metrics.payout_factor = data.get("payout_factor", PAYOUT_FACTOR)
         metrics.last_evaluation_timestamp = data.get("last_evaluation_timestamp")
 
@@ -118,8 +146,8 @@ class EvaluationMetrics:
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        total_score = sum(self.scores)
-        active_miners = sum(1 for s in self.scores if s > 0)
+        total_score = float(self.scores.sum())
+        active_miners = int(np.count_nonzero(self.scores > 0))
         return (
             f"EvaluationMetrics(coin={self.coin}, "
             f"active_miners={active_miners}, "
@@ -4,12 +4,14 @@ Proxy pool metrics implementation for time-based queries.
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from taohash.core.pool.proxy.pool import ProxyPool
 from taohash.core.constants import PAYOUT_FACTOR, BLOCK_REWARDS
 from .base import BaseMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyMetrics(BaseMetrics):
     """
     Mining Metrics for Proxy pool.
@@ -46,34 +48,25 @@ class ProxyMetrics(BaseMetrics):
         return 0.0
 
 
-def get_metrics_timerange(
-    pool: ProxyPool,
-    hotkeys: list[str],
-    block_at_registration: list[int],
-    start_time: int,
-    end_time: int,
-    coin: str = "bitcoin",
-) -> dict[str, any]:
+def map_hotkeys_to_workers(
+    pool: ProxyPool, hotkeys: list[str], block_at_registration: list[int]
+) -> dict[str, str]:
     """
-    Retrieves mining metrics for all miners for a specific time range.
+    Map each hotkey to its worker ID, resolving duplicate worker IDs
+    in favor of the older registration.
+
+    The mapping only changes when the metagraph does, so callers that
+    evaluate repeatedly should build it once per resync and pass it to the
+    timerange functions instead of recomputing it per call.
 
     Args:
-        pool: The pool instance to query (must be ProxyPool)
+        pool: The pool instance used to derive worker IDs
         hotkeys: List of miner hotkeys
         block_at_registration: List of registration blocks for each hotkey
-        start_time: Start time as unix timestamp
-        end_time: End time as unix timestamp
-        coin: The coin type (default: "bitcoin")
 
     Returns:
-        Dict containing list of ProxyMetrics and payout factor
+        Dict mapping hotkeys to worker IDs (duplicates removed)
     """
-    metrics = []
-    timerange_data = pool.get_miner_contributions_timerange(start_time, end_time, coin)
-
-    all_workers = timerange_data.get("workers", {})
-    payout_factor = timerange_data.get("payout_factor", PAYOUT_FACTOR)
-
     hotkeys_to_workers = {}
     worker_ids_to_hotkey_idx = {}
 
@@ -95,6 +88,45 @@ def get_metrics_timerange(
             worker_ids_to_hotkey_idx[worker_id] = i
             hotkeys_to_workers[hotkey] = worker_id
 
+    return hotkeys_to_workers
+
+
+def get_metrics_timerange(
+    pool: ProxyPool,
+    hotkeys: list[str],
+    block_at_registration: list[int],
+    start_time: int,
+    end_time: int,
+    coin: str = "bitcoin",
+    hotkeys_to_workers: dict[str, str] = None,
+) -> dict[str, any]:
+    """
+    Retrieves mining metrics for all miners for a specific time range.
+
+    Args:
+        pool: The pool instance to query (must be ProxyPool)
+        hotkeys: List of miner hotkeys
+        block_at_registration: List of registration blocks for each hotkey
+        start_time: Start time as unix timestamp
+        end_time: End time as unix timestamp
+        coin: The coin type (default: "bitcoin")
+        hotkeys_to_workers: Optional precomputed hotkey -> worker ID mapping;
+            built from the arguments when not provided
+
+    Returns:
+        Dict containing list of ProxyMetrics and payout factor
+    """
+    metrics = []
+    timerange_data = pool.get_miner_contributions_timerange(start_time, end_time, coin)
+
+    all_workers = timerange_data.get("workers", {})
+    payout_factor = timerange_data.get("payout_factor", PAYOUT_FACTOR)
+
+    if hotkeys_to_workers is None:
+        hotkeys_to_workers = map_hotkeys_to_workers(
+            pool, hotkeys, block_at_registration
+        )
+
     for hotkey in hotkeys:
         worker_id = hotkeys_to_workers.get(hotkey)
 
@@ -116,3 +148,89 @@ def get_metrics_timerange(
         )
 
     return {"metrics": metrics, "payout_factor": payout_factor}
+
+
+def get_metrics_timerange_arrays(
+    pool: ProxyPool,
+    hotkeys: list[str],
+    block_at_registration: list[int],
+    start_time: int,
+    end_time: int,
+    coin: str = "bitcoin",
+    hotkeys_to_workers: dict[str, str] = None,
+) -> dict[str, any]:
+    """
+    Retrieves mining metrics for a time range as parallel arrays.
+
+    Structure-of-arrays variant of `get_metrics_timerange`: instead of one
+    ProxyMetrics instance per hotkey, returns the UIDs and raw share values
+    of miners that reported work, so score accumulation can be done with a
+    single vectorized update instead of a per-miner Python loop.
+
+    Args:
+        pool: The pool instance to query (must be ProxyPool)
+        hotkeys: List of miner hotkeys (index in this list is the UID)
+        block_at_registration: List of registration blocks for each hotkey
+        start_time: Start time as unix timestamp
+        end_time: End time as unix timestamp
+        coin: The coin type (default: "bitcoin")
+        hotkeys_to_workers: Optional precomputed hotkey -> worker ID mapping;
+            built from the arguments when not provided
+
+    Returns:
+        Dict containing `uids` (int64 array), `share_values` (float64 array)
+        aligned with `uids`, and the payout factor
+    """
+    timerange_data = pool.get_miner_contributions_timerange(start_time, end_time, coin)
+
+    all_workers = timerange_data.get("workers", {})
+    payout_factor = timerange_data.get("payout_factor", PAYOUT_FACTOR)
+
+    if hotkeys_to_workers is None:
+        hotkeys_to_workers = map_hotkeys_to_workers(
+            pool, hotkeys, block_at_registration
+        )
+
+    uids = []
+    share_values = []
+    for uid, hotkey in enumerate(hotkeys):
+        worker_id = hotkeys_to_workers.get(hotkey)
+        if worker_id is None:
+            continue
+
+        worker_data = all_workers.get(worker_id)
+        if not worker_data:
+            continue
+
+        share_value = worker_data.get("share_value", 0.0)
+        if share_value:
+            uids.append(uid)
+            share_values.append(share_value)
+
+    return {
+        "uids": np.asarray(uids, dtype=np.int64),
+        "share_values": np.asarray(share_values, dtype=np.float64),
+        "payout_factor": payout_factor,
+    }
+
+
+def share_values_to_fiat(
+    share_values: np.ndarray, coin_price: float, coin_difficulty: float, coin: str
+) -> np.ndarray:
+    """
+    Convert raw share values to USD in one vectorized operation.
+
+    Vectorized equivalent of `ProxyMetrics.get_share_value_fiat` for the
+    arrays returned by `get_metrics_timerange_arrays`.
+
+    Args:
+        share_values: Raw share values per miner
+        coin_price: Current coin price in USD
+        coin_difficulty: Current network difficulty for the coin
+        coin: Coin identifier (e.g., "btc", "bch")
+
+    Returns:
+        Array of share values in USD, aligned with the input
+    """
+    block_reward = BLOCK_REWARDS.get(coin, 3.125)
+    return share_values * (block_reward * coin_price / coin_difficulty)
@@ -38,6 +38,7 @@ class PoolBase(metaclass=abc.ABCMeta):
     def __init__(self, pool_info: PoolInfo, api: PoolAPI) -> None:
         self.pool_info = pool_info
         self.api = api
+        self._encoded_info: bytes | None = None
 
     @staticmethod
     def _get_worker_id_for_hotkey(hotkey: str) -> str:
@@ -113,3 +114,17 @@ class PoolBase(metaclass=abc.ABCMeta):
             PoolInfo object containing connection details
         """
         return self.pool_info
+
+    def get_encoded_info(self) -> bytes:
+        """
+        Get the encoded pool information, caching the bytes.
+
+        The pool configuration is immutable after startup, so the encoding
+        is done once and repeated publish attempts compare raw bytes.
+
+        Returns:
+            Binary encoded pool information for chain commitment
+        """
+        if self._encoded_info is None:
+            self._encoded_info = self.pool_info.encode()
+        return self._encoded_info
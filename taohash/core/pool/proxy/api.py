@@ -1,5 +1,6 @@
 import base64
 import httpx
+import orjson
 from typing import Optional, Any
 from backoff import on_exception, expo
 from ratelimit import limits, RateLimitException
@@ -31,6 +32,10 @@ class ProxyPoolAPI(PoolAPI):
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json",
         }
+        # One keep-alive client per API instance; the validator polls the
+        # proxy on a fixed cadence and reconnecting per call paid a full
+        # TCP+TLS handshake each time.
+        self._client = httpx.Client(timeout=180, headers=self.headers)
 
         if self.test_connection():
             logging.success(f"Health check passed for {coin.upper()} Pool API.")
@@ -69,30 +74,29 @@ class ProxyPoolAPI(PoolAPI):
         url = f"{self.proxy_url}/api/workers/stats"
         params = {"worker": worker_id}
 
-        with httpx.Client(timeout=180) as client:
-            response = client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
+        response = self._client.get(url, params=params)
+        response.raise_for_status()
 
-            data = response.json()
+        data = orjson.loads(response.content)
 
-            workers = data.get("btc", {}).get("workers", {})
+        workers = data.get("btc", {}).get("workers", {})
 
-            if worker_id not in workers:
-                logging.debug(f"Worker {worker_id} not found in proxy response")
-                return None
+        if worker_id not in workers:
+            logging.debug(f"Worker {worker_id} not found in proxy response")
+            return None
 
-            worker_data = workers[self._worker_name_to_worker_id(worker_id)]
+        worker_data = workers[self._worker_name_to_worker_id(worker_id)]
 
-            return {
-                "hash_rate_5m": worker_data.get("hash_rate_5m", 0.0),
-                "hash_rate_60m": worker_data.get("hash_rate_60m", 0.0),
-                "hash_rate_unit": worker_data.get("hash_rate_unit", "Gh/s"),
-                "shares_5m": worker_data.get("shares_5m", 0),
-                "shares_60m": worker_data.get("shares_60m", 0),
-                "share_value_5m": worker_data.get("share_value_5m", 0.0),
-                "share_value_60m": worker_data.get("share_value_60m", 0.0),
-                "share_value_24h": worker_data.get("share_value_24h", 0.0),
-            }
+        return {
+            "hash_rate_5m": worker_data.get("hash_rate_5m", 0.0),
+            "hash_rate_60m": worker_data.get("hash_rate_60m", 0.0),
+            "hash_rate_unit": worker_data.get("hash_rate_unit", "Gh/s"),
+            "shares_5m": worker_data.get("shares_5m", 0),
+            "shares_60m": worker_data.get("shares_60m", 0),
+            "share_value_5m": worker_data.get("share_value_5m", 0.0),
+            "share_value_60m": worker_data.get("share_value_60m", 0.0),
+            "share_value_24h": worker_data.get("share_value_24h", 0.0),
+        }
 
     @on_exception(
         expo,
@@ -112,28 +116,27 @@ class ProxyPoolAPI(PoolAPI):
         """
         url = f"{self.proxy_url}/api/workers/stats"
 
-        with httpx.Client(timeout=180) as client:
-            response = client.get(url, headers=self.headers)
-            response.raise_for_status()
+        response = self._client.get(url)
+        response.raise_for_status()
 
-            data = response.json()
+        data = orjson.loads(response.content)
 
-            workers = data.get("btc", {}).get("workers", {})
+        workers = data.get("btc", {}).get("workers", {})
 
-            result = {}
-            for worker_id, worker_data in workers.items():
-                result[worker_id] = {
-                    "hash_rate_5m": worker_data.get("hash_rate_5m", 0.0),
-                    "hash_rate_60m": worker_data.get("hash_rate_60m", 0.0),
-                    "hash_rate_unit": worker_data.get("hash_rate_unit", "Gh/s"),
-                    "shares_5m": worker_data.get("shares_5m", 0),
-                    "shares_60m": worker_data.get("shares_60m", 0),
-                    "share_value_5m": worker_data.get("share_value_5m", 0.0),
-                    "share_value_60m": worker_data.get("share_value_60m", 0.0),
-                    "share_value_24h": worker_data.get("share_value_24h", 0.0),
-                }
+        result = {}
+        for worker_id, worker_data in workers.items():
+            result[worker_id] = {
+                "hash_rate_5m": worker_data.get("hash_rate_5m", 0.0),
+                "hash_rate_60m": worker_data.get("hash_rate_60m", 0.0),
+                "hash_rate_unit": worker_data.get("hash_rate_unit", "Gh/s"),
+                "shares_5m": worker_data.get("shares_5m", 0),
+                "shares_60m": worker_data.get("shares_60m", 0),
+                "share_value_5m": worker_data.get("share_value_5m", 0.0),
+                "share_value_60m": worker_data.get("share_value_60m", 0.0),
+                "share_value_24h": worker_data.get("share_value_24h", 0.0),
+            }
 
-            return result
+        return result
 
     @on_exception(
         expo,
@@ -158,20 +161,19 @@ class ProxyPoolAPI(PoolAPI):
         url = f"{self.proxy_url}/api/workers/timerange"
         params = {"start_time": start_time, "end_time": end_time}
 
-        with httpx.Client(timeout=180) as client:
-            response = client.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
+        response = self._client.get(url, params=params)
+        response.raise_for_status()
 
-            data = response.json()
-            payout_factor = data.get(coin, {}).get("worker_percentage", PAYOUT_FACTOR)
+        data = orjson.loads(response.content)
+        payout_factor = data.get(coin, {}).get("worker_percentage", PAYOUT_FACTOR)
 
-            workers = data.get(coin, {}).get("workers", {})
+        workers = data.get(coin, {}).get("workers", {})
 
-            worker_result = {}
-            for worker_id, worker_data in workers.items():
-                worker_result[self._worker_name_to_worker_id(worker_id)] = worker_data
+        worker_result = {}
+        for worker_id, worker_data in workers.items():
+            worker_result[self._worker_name_to_worker_id(worker_id)] = worker_data
 
-            return {"workers": worker_result, "payout_factor": payout_factor}
+        return {"workers": worker_result, "payout_factor": payout_factor}
 
     def get_fpps(self, coin: str = "bitcoin") -> float:
         """
@@ -201,10 +203,9 @@ class ProxyPoolAPI(PoolAPI):
         """Test API connection and authentication by hitting the /health endpoint"""
         try:
             url = f"{self.proxy_url}/health"
-            with httpx.Client(timeout=10) as client:
-                response = client.get(url, headers=self.headers)
-                response.raise_for_status()
-                return True
+            response = self._client.get(url, timeout=10)
+            response.raise_for_status()
+            return True
         except Exception as e:
             logging.error(f"Failed to connect to Proxy Pool API: {str(e)}")
             return False
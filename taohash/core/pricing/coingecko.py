@@ -1,9 +1,16 @@
 from typing import Optional
 
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
 
 from taohash.core.pricing.price import NetworkedCoinPriceAPI
 
+# Keep-alive session shared by all instances; price fetches hit the same
+# host every TTL window and reconnecting paid a TLS handshake each time
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
 
 class CoinGeckoAPI(NetworkedCoinPriceAPI):
     """
@@ -33,24 +40,25 @@ class CoinGeckoAPI(NetworkedCoinPriceAPI):
         Raises:
             ValueError: If the API request fails
         """
-        coin_slug = self.coin_map.get(coin, coin)
-        prices = self._get_prices([coin_slug], vs)
-        return prices[coin_slug]
+        return self._get_prices([coin], vs)[coin]
 
     def _get_prices(self, coins: list[str], vs: str = "usd") -> dict[str, float]:
         """
         Get current prices for multiple coins.
 
         Args:
-            coins: List of coin IDs (e.g., ["bitcoin", "ethereum"])
+            coins: List of coin IDs or short symbols (e.g., ["bitcoin", "bch"])
             vs: The currency to convert to (default: "usd")
 
         Returns:
-            Dictionary mapping coin IDs to their prices
+            Dictionary mapping the requested identifiers to their prices
 
         Raises:
             ValueError: If the API request fails
         """
+        # Short symbols map to CoinGecko IDs; results key back to the
+        # caller's identifiers so the cache layer stays consistent
+        slugs = [self.coin_map.get(coin, coin) for coin in coins]
         if self.is_pro:
             url = "https://pro-api.coingecko.com/api/v3/simple/price"
             headers = {"accept": "application/json", "x-cg-pro-api-key": self.api_key}
@@ -58,20 +66,20 @@ class CoinGeckoAPI(NetworkedCoinPriceAPI):
             url = "https://api.coingecko.com/api/v3/simple/price"
             headers = {"accept": "application/json"}
 
-        response = requests.get(
+        response = _session.get(
             url=url,
             headers=headers,
-            params={"ids": ",".join(coins), "vs_currencies": vs},
+            params={"ids": ",".join(slugs), "vs_currencies": vs},
         )
 
         if response.status_code != 200:
             raise ValueError(f"Could not get price from CoinGecko: {response.text}")
 
-        result = response.json()
+        result = orjson.loads(response.content)
         prices = {}
-        for coin in coins:
-            if coin not in result:
-                raise ValueError(f"Coin {coin} not found in CoinGecko response")
-            prices[coin] = float(result[coin][vs])
+        for coin, slug in zip(coins, slugs):
+            if slug not in result:
+                raise ValueError(f"Coin {slug} not found in CoinGecko response")
+            prices[coin] = float(result[slug][vs])
 
         return prices
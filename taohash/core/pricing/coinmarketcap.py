@@ -1,7 +1,14 @@
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
 
 from taohash.core.pricing.price import NetworkedCoinPriceAPI
 
+# Keep-alive session shared by all instances; price fetches hit the same
+# host every TTL window and reconnecting paid a TLS handshake each time
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
 
 class CoinMarketCapAPI(NetworkedCoinPriceAPI):
     """
@@ -13,6 +20,10 @@ class CoinMarketCapAPI(NetworkedCoinPriceAPI):
         if not api_key:
             raise ValueError("CoinMarketCap API requires an API key")
         super().__init__(api_key)
+        self.coin_map = {
+            "btc": "bitcoin",
+            "bch": "bitcoin-cash",
+        }
         self.query_url = (
             "https://pro-api.coinmarketcap.com/v2/cryptocurrency/quotes/latest"
         )
@@ -42,11 +53,11 @@ class CoinMarketCapAPI(NetworkedCoinPriceAPI):
         Get current prices for multiple coins.
 
         Args:
-            coins: List of coin slugs (e.g., ["bitcoin", "ethereum"])
+            coins: List of coin slugs or short symbols (e.g., ["bitcoin", "bch"])
             vs: The currency to convert to (only "usd" supported currently)
 
         Returns:
-            Dictionary mapping coin slugs to their prices
+            Dictionary mapping the requested identifiers to their prices
 
         Raises:
             ValueError: If the API request fails or currency not supported
@@ -54,21 +65,23 @@ class CoinMarketCapAPI(NetworkedCoinPriceAPI):
         if vs.lower() != "usd":
             raise ValueError("CoinMarketCap implementation currently only supports USD")
 
-        params = {"slug": ",".join(coins)}
+        # Short symbols map to CoinMarketCap slugs; results key back to the
+        # caller's identifiers so the cache layer stays consistent
+        slug_to_coin = {self.coin_map.get(coin, coin).lower(): coin for coin in coins}
+        params = {"slug": ",".join(slug_to_coin)}
         headers = {"X-CMC_PRO_API_KEY": self.api_key, "Accept": "application/json"}
-        response = requests.get(self.query_url, params=params, headers=headers)
+        response = _session.get(self.query_url, params=params, headers=headers)
 
         if response.status_code != 200:
             raise ValueError(f"Could not get price from CoinMarketCap: {response.text}")
 
-        data = response.json()
+        data = orjson.loads(response.content)
         result = {}
         for _, coins_data in data["data"].items():
             for coin_data in (
                 coins_data if isinstance(coins_data, list) else [coins_data]
             ):
-                if coin_data["slug"] in [c.lower() for c in coins]:
-                    result[coin_data["slug"]] = float(
-                        coin_data["quote"][vs.upper()]["price"]
-                    )
+                coin = slug_to_coin.get(coin_data["slug"])
+                if coin is not None:
+                    result[coin] = float(coin_data["quote"][vs.upper()]["price"])
         return result
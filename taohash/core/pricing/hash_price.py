@@ -1,7 +1,7 @@
 from typing import Optional
 
-import cachetools
 import requests
+import orjson
 from backoff import expo, on_exception
 from cachetools import TTLCache
 from ratelimit import RateLimitException, limits
@@ -43,19 +43,28 @@ class BraiinsHashPriceAPI(HashPriceAPIBase):
                 f"Could not get hashrate stats from Braiins: {response.text}"
             )
 
-        return response.json()
+        return orjson.loads(response.content)
 
-    @cachetools.cached(cache=_hash_price_cache)
     def get_hash_price(self, coin: str) -> Optional[float]:
         """
         Get the current hash price in USD/TH/day from Braiins Pool insights
 
+        Successful lookups are cached per coin; failures are not, so a
+        transient API outage doesn't pin None for the whole TTL.
+
         Returns:
             float: Current hash price or None if unavailable
         """
+        cached_price = _hash_price_cache.get(coin)
+        if cached_price is not None:
+            return cached_price
+
         try:
             stats = self.get_hashrate_stats()
-            return float(stats["hash_price"])
+            hash_price = float(stats["hash_price"])
         except Exception as e:
             print(f"Error fetching hash price from Braiins: {e}")
             return None
+
+        _hash_price_cache[coin] = hash_price
+        return hash_price
@@ -5,6 +5,8 @@ Provides methods to fetch current network statistics (difficulty)
 for various coins, with caching to minimize API calls.
 """
 
+import threading
+
 import requests
 from bittensor import logging
 from cachetools import TTLCache
@@ -12,7 +14,9 @@ from typing import Any
 
 
 DIFFICULTY_TTL = 1 * 60 * 60  # 1 hour
+# TTLCache is not thread-safe, so every access goes through the lock
 _difficulty_cache = TTLCache(maxsize=10, ttl=DIFFICULTY_TTL)
+_difficulty_cache_lock = threading.Lock()
 
 API_TIMEOUT = 10  # seconds
 
@@ -75,12 +79,14 @@ def get_current_difficulty(coin: str = "btc") -> float:
     """
     cache_key = f"difficulty_{coin}"
 
-    if cache_key in _difficulty_cache:
-        return _difficulty_cache[cache_key]
+    with _difficulty_cache_lock:
+        if cache_key in _difficulty_cache:
+            return _difficulty_cache[cache_key]
 
     try:
         difficulty = _fetch_difficulty(coin)
-        _difficulty_cache[cache_key] = difficulty
+        with _difficulty_cache_lock:
+            _difficulty_cache[cache_key] = difficulty
         return difficulty
 
     except requests.Timeout:
@@ -1,4 +1,6 @@
 import abc
+import threading
+from collections import defaultdict
 from typing import Optional
 
 import cachetools
@@ -6,8 +8,11 @@ from cachetools import TTLCache
 
 PRICE_TTL = 5 * 60  # 5 minutes
 
-# Cache
+# Cache; TTLCache is not thread-safe, so every access goes through the lock
 _price_cache = TTLCache(maxsize=64, ttl=PRICE_TTL)
+_price_cache_lock = threading.Lock()
+# One lock per coin so concurrent misses coalesce into a single fetch
+_price_locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
 
 
 class CoinPriceAPIBase(metaclass=abc.ABCMeta):
@@ -36,6 +41,21 @@ class CoinPriceAPIBase(metaclass=abc.ABCMeta):
         """
         pass
 
+    def get_prices(self, coins: list[str]) -> dict[str, Optional[float]]:
+        """
+        Get prices for multiple coins at once.
+
+        Networked implementations override this with a single batched
+        request; the default simply loops over `get_price`.
+
+        Args:
+            coins: List of coin identifiers
+
+        Returns:
+            Dictionary mapping coin identifiers to their prices
+        """
+        return {coin: self.get_price(coin) for coin in coins}
+
 
 class OfflineCoinPriceAPI(CoinPriceAPIBase):
     """
@@ -83,22 +103,38 @@ class NetworkedCoinPriceAPI(CoinPriceAPIBase):
         """
         return {coin: self._get_price(coin) for coin in coins}
 
-    @cachetools.cached(cache=_price_cache)
     def get_price(self, coin: str) -> Optional[float]:
         """
         Get a coin's price with caching.
 
+        Concurrent callers asking for the same uncached coin (e.g. the
+        pricing prefetch racing an evaluation thread) share one request
+        instead of each hitting the provider.
+
         Args:
             coin: Symbol or identifier for the cryptocurrency
 
         Returns:
             The current price in USD, or None if fetch fails
         """
-        try:
-            return self._get_price(coin)
-        except Exception as e:
-            print(e)
-            return None
+        cache_key = cachetools.keys.hashkey(coin)
+        with _price_cache_lock:
+            if cache_key in _price_cache:
+                return _price_cache[cache_key]
+
+        with _price_locks[coin]:
+            # Another caller may have fetched while we waited
+            with _price_cache_lock:
+                if cache_key in _price_cache:
+                    return _price_cache[cache_key]
+            try:
+                price = self._get_price(coin)
+            except Exception as e:
+                print(e)
+                return None
+            with _price_cache_lock:
+                _price_cache[cache_key] = price
+            return price
 
     def get_prices(self, coins: list[str]) -> dict[str, Optional[float]]:
         """
@@ -113,26 +149,28 @@ class NetworkedCoinPriceAPI(CoinPriceAPIBase):
         result = {}
         all_cached = True
 
-        for coin in coins:
-            # Check in cache
-            cache_key = cachetools.keys.hashkey(coin)
-            if cache_key in _price_cache:
-                result[coin] = _price_cache[cache_key]
-            else:
-                all_cached = False
-                break
+        with _price_cache_lock:
+            for coin in coins:
+                # Check in cache
+                cache_key = cachetools.keys.hashkey(coin)
+                if cache_key in _price_cache:
+                    result[coin] = _price_cache[cache_key]
+                else:
+                    all_cached = False
+                    break
 
         # If any coin was missing, fetch all prices fresh
         if not all_cached:
             try:
                 latest_prices = self._get_prices(coins)
+            except Exception as e:
+                print(f"Error fetching batch prices: {e}")
+                return {coin: None for coin in coins}
+            with _price_cache_lock:
                 for coin, price in latest_prices.items():
                     result[coin] = price
                     cache_key = cachetools.keys.hashkey(coin)
                     _price_cache[cache_key] = price
-            except Exception as e:
-                print(f"Error fetching batch prices: {e}")
-                return {coin: None for coin in coins}
 
         return result
 
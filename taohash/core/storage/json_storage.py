@@ -1,7 +1,8 @@
 import argparse
-import json
 import os
 import time
+
+import orjson
 from pathlib import Path
 from typing import Any, Optional
 
@@ -19,9 +20,9 @@ DYNAMIC_FILES_PATH = "dynamic"
 def _read_json(file_path: Path) -> Optional[dict]:
     """Read JSON file and return deserialized data."""
     try:
-        with file_path.open("r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
+        with file_path.open("rb") as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, FileNotFoundError):
         logging.error(f"Error loading/decoding [red]{file_path.as_posix()}[/red] file.")
         return None
 
@@ -114,9 +115,17 @@ class BaseJsonStorage(BaseStorage):
 
         data_file = dynamic_files_path / file_name
 
+        # Serialize once with orjson and write to a temp file swapped in with
+        # os.replace, so a crash mid-write can never truncate the previous
+        # state file.
         try:
-            with open(data_file, "w") as f:
-                json.dump(data, f, indent=4)
+            payload = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+            tmp_file = data_file.with_suffix(".json.tmp")
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, data_file)
         except Exception as e:
             logging.error(f"Error saving data to {data_file.as_posix()}: {str(e)}")
 
@@ -1,7 +1,9 @@
 import argparse
+import logging as std_logging
 import os
 from typing import Optional
 
+import numpy as np
 from bittensor import Subtensor, config, logging
 from bittensor_wallet import Wallet
 from tabulate import tabulate
@@ -201,7 +203,7 @@ class BaseValidator:
             logging.info(f"Metagraph size increased from {old_size} to {new_size}")
 
             for metrics in self.evaluation_metrics.values():
-                metrics.scores.extend([0.0] * (new_size - old_size))
+                metrics.scores = np.pad(metrics.scores, (0, new_size - old_size))
 
             # Log new registrations
             for uid in range(old_size, new_size):
@@ -234,9 +236,14 @@ class BaseValidator:
         )
         return sn_owner_hotkey
 
-    def get_next_sync_block(self) -> tuple[int, str]:
+    def get_next_sync_block(
+        self, blocks_since_last_weights: Optional[int] = None
+    ) -> tuple[int, str]:
         """
         Calculate the next block to sync at.
+        Args:
+            blocks_since_last_weights: Blocks since weights were last set, if
+                the caller already fetched it this tick; queried when None.
         Returns:
             tuple[int, str]: (next_block, sync_reason)
             - next_block: the block number to sync at
@@ -245,9 +252,10 @@ class BaseValidator:
         sync_reason = "Regular sync"
         next_sync = self.current_block + self.eval_interval
 
-        blocks_since_last_weights = self.subtensor.blocks_since_last_update(
-            self.config.netuid, self.uid
-        )
+        if blocks_since_last_weights is None:
+            blocks_since_last_weights = self.subtensor.blocks_since_last_update(
+                self.config.netuid, self.uid
+            )
         # Calculate when we'll need to set weights
         blocks_until_weights = self.weights_interval - blocks_since_last_weights
         next_weights_block = self.current_block + blocks_until_weights + 1
@@ -284,35 +292,58 @@ class BaseValidator:
             target_block = self.current_block + (self.tempo - blocks_since_last_step)
             self.subtensor.wait_for_block(target_block)
 
+    @staticmethod
+    def _format_table(rows: list[list], headers: list[str], tablefmt: str) -> str:
+        """
+        Format rows for logging.
+
+        Uses tabulate for readable small tables; very large tables fall back
+        to a plain join since tabulate's column reflow is quadratic in width
+        and the output is unreadable at that size anyway.
+        """
+        if len(rows) <= 500:
+            return tabulate(
+                rows,
+                headers=headers,
+                tablefmt=tablefmt,
+                numalign="right",
+                stralign="left",
+            )
+        header_line = " | ".join(headers)
+        return "\n".join(
+            [header_line]
+            + [" | ".join(str(cell) for cell in row) for row in rows]
+        )
+
     def _log_weights_and_scores(self, weights: list[float]) -> None:
         """Log weights and scores in a tabular format."""
+        if not logging.isEnabledFor(std_logging.INFO):
+            return
+
         rows = []
         headers = ["UID", "Hotkey", "Weight", "Normalized (%)"]
 
-        # Sort by weight (highest first)
-        sorted_indices = sorted(
-            range(len(weights)), key=lambda w: weights[w], reverse=True
-        )
-
-        for i in sorted_indices:
-            if weights[i] > 0:
-                hotkey = self.metagraph.hotkeys[i]
-                rows.append(
-                    [
-                        i,
-                        f"{hotkey}",
-                        f"{weights[i]:.10f}",
-                        f"{weights[i] * 100:.10f}%",
-                    ]
-                )
+        # Sort only the nonzero weights (highest first)
+        weights_arr = np.asarray(weights)
+        active = np.flatnonzero(weights_arr > 0)
+        sorted_indices = active[np.argsort(-weights_arr[active])]
+
+        for i in sorted_indices.tolist():
+            hotkey = self.metagraph.hotkeys[i]
+            rows.append(
+                [
+                    i,
+                    f"{hotkey}",
+                    f"{weights[i]:.10f}",
+                    f"{weights[i] * 100:.10f}%",
+                ]
+            )
 
         if not rows:
             logging.info(f"No miners receiving weights at Block {self.current_block}")
             return
 
-        table = tabulate(
-            rows, headers=headers, tablefmt="grid", numalign="right", stralign="left"
-        )
+        table = self._format_table(rows, headers, tablefmt="grid")
         title = f"Weights set at Block: {self.current_block}"
         logging.info(f"{title}\n{table}")
 
@@ -336,6 +367,9 @@ class BaseValidator:
         self, coin: str, rows: list[list[str]], timeframe_seconds: int
     ) -> None:
         """Print per-coin share value contributions for the current evaluation cycle."""
+        if not logging.isEnabledFor(std_logging.INFO):
+            return
+
         if not rows:
             logging.info(
                 f"No valid share values for {coin.upper()} during timeframe {timeframe_seconds}s "
@@ -343,12 +377,10 @@ class BaseValidator:
             )
             return
 
-        table = tabulate(
+        table = self._format_table(
             rows,
             headers=["UID", "Hotkey", f"{coin.upper()} Share Value"],
             tablefmt="outline",
-            numalign="right",
-            stralign="left",
         )
         title = f"Evaluation summary - {coin.upper()} (Timeframe: {timeframe_seconds}s) - Block {self.current_block}"
         logging.info(f".\n{title}\n{table}")
@@ -4,10 +4,14 @@
 # Licensed under MIT
 
 import argparse
+import hashlib
+import logging as std_logging
+import random
 import traceback
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from tabulate import tabulate
+import numpy as np
 
 from bittensor import logging, Subtensor
 from bittensor_wallet.bittensor_wallet import Wallet
@@ -16,9 +20,9 @@ from dotenv import load_dotenv
 from taohash.core.chain_data.pool_info import (
     publish_pool_info,
     get_pool_info,
-    encode_pool_info,
 )
 from taohash.core.constants import (
+    BLOCK_TIME,
     VERSION_KEY,
     U16_MAX,
     OWNER_TAKE,
@@ -26,9 +30,10 @@ from taohash.core.constants import (
 )
 from taohash.core.pool import PoolBase
 from taohash.core.pool.metrics import (
-    ProxyMetrics,
-    get_metrics_timerange,
     EvaluationMetrics,
+    get_metrics_timerange_arrays,
+    map_hotkeys_to_workers,
+    share_values_to_fiat,
 )
 from taohash.core.pool.proxy import ProxyPool, ProxyPoolAPI
 from taohash.core.pool.proxy.config import ProxyPoolAPIConfig, ProxyPoolConfig
@@ -38,7 +43,10 @@ from taohash.validator import BaseValidator
 
 SUPPORTED_COINS = ["btc", "bch"]
 
-BAD_COLDKEYS = ["5CS96ckqKnd2snQ4rQKAvUpMh2pikRmCHb4H7TDzEt2AM9ZB"]
+BAD_COLDKEYS = frozenset({"5CS96ckqKnd2snQ4rQKAvUpMh2pikRmCHb4H7TDzEt2AM9ZB"})
+
+# Fraction of emissions distributable to miners after the owner's take
+_MINER_SHARE = (1 - OWNER_TAKE) * SPLIT_WITH_MINERS
 
 
 class TaohashProxyValidator(BaseValidator):
@@ -59,13 +67,63 @@ class TaohashProxyValidator(BaseValidator):
         self.setup_remote_pool_access()
         self.price_api = CoinPriceAPI("coingecko", None)
 
-        self.alpha = 0.8
+        self._hotkeys_to_workers: dict[str, str] = {}
+        self._rebuild_worker_map()
+
+        # Asymmetric EMA: scores rise quickly but decay slowly, which keeps
+        # weights stable across validators submitting at different points in
+        # the tempo and reduces VTrust volatility.
+        self.positive_alpha = self.config.positive_alpha
+        self.negative_alpha = self.config.negative_alpha
+        self.moving_avg_scores = np.zeros(len(self.hotkeys), dtype=np.float64)
+        # Reused every weights tick; reallocated only when the metagraph grows
+        self._weight_buf = np.zeros(len(self.hotkeys), dtype=np.float64)
+        self._uids = list(range(len(self.hotkeys)))
+
+        # Prefetches pricing data while waiting for the next sync block
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="validator-io"
+        )
+        # Background chain queries run on their own connection with a single
+        # worker: the sync substrate websocket tolerates at most one in-flight
+        # call, so they must never share self.subtensor with the main thread
+        # or each other
+        self._chain_subtensor = Subtensor(config=self.config)
+        self._chain_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="validator-chain"
+        )
+        self._prefetch_future = None
+        self._last_traceback_time = 0.0
+        # Per-coin evaluation fetches run concurrently when several coins
+        # are configured
+        self._eval_executor = ThreadPoolExecutor(
+            max_workers=len(SUPPORTED_COINS), thread_name_prefix="validator-eval"
+        )
+        # State writes happen off the main loop; a single worker keeps saves
+        # ordered so an older snapshot can never overwrite a newer one
+        self._save_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="validator-save"
+        )
+
         self.weights_interval = self.tempo
 
     def add_args(self, parser: argparse.ArgumentParser):
         """Add validator arguments to the parser."""
         super().add_args(parser)
 
+        parser.add_argument(
+            "--positive_alpha",
+            type=float,
+            default=0.3,
+            help="EMA weight applied when a miner's score increases.",
+        )
+        parser.add_argument(
+            "--negative_alpha",
+            type=float,
+            default=0.09,
+            help="EMA weight applied when a miner's score decreases (slower decay).",
+        )
+
         ProxyPoolConfig.add_args(parser)
         ProxyPoolAPIConfig.add_args(parser)
 
@@ -86,6 +144,41 @@ class TaohashProxyValidator(BaseValidator):
         for coin in self.config.coins:
             self.evaluation_metrics[coin] = EvaluationMetrics(coin, num_hotkeys)
 
+    def resync_metagraph(self) -> None:
+        """Resync the metagraph and keep the EMA scores aligned with it."""
+        previous_hotkeys = self.hotkeys
+        super().resync_metagraph()
+
+        num_hotkeys = len(self.hotkeys)
+        if self.moving_avg_scores.size < num_hotkeys:
+            self.moving_avg_scores = np.pad(
+                self.moving_avg_scores, (0, num_hotkeys - self.moving_avg_scores.size)
+            )
+        # Reset the EMA for replaced hotkeys so new registrations start fresh
+        for uid, hotkey in enumerate(previous_hotkeys):
+            if uid < num_hotkeys and hotkey != self.hotkeys[uid]:
+                self.moving_avg_scores[uid] = 0.0
+
+        if self._weight_buf.size != num_hotkeys:
+            self._weight_buf = np.zeros(num_hotkeys, dtype=np.float64)
+            self._uids = list(range(num_hotkeys))
+
+        if previous_hotkeys != self.hotkeys:
+            self._rebuild_worker_map()
+
+    def _rebuild_worker_map(self) -> None:
+        """Rebuild the hotkey -> worker ID mapping after a metagraph change.
+
+        Worker IDs are derived from the hotkey alone, so one mapping serves
+        every configured coin and only changes when the metagraph does.
+        """
+        if not self.pools:
+            return
+        pool = next(iter(self.pools.values()))
+        self._hotkeys_to_workers = map_hotkeys_to_workers(
+            pool, self.hotkeys, self.block_at_registration
+        )
+
     def setup_remote_pool_access(self) -> None:
         """Create ProxyPool instances for each configured coin using env-provided credentials."""
         for coin in self.config.coins:
@@ -112,32 +205,68 @@ class TaohashProxyValidator(BaseValidator):
         """
         Publish the mining pool info to bittensor.
         Process:
-            1. Check if pool info is already published.
-            2. If not, publish the pool info to the chain.
-            3. Update the pool info if it is outdated.
+            1. Check the locally stored hash of the last published pool info.
+            2. If it differs, check if pool info is already published.
+            3. If not, publish the pool info to the chain.
+            4. Update the pool info if it is outdated.
         """
-        pool_info = pool.get_pool_info()
-        pool_info_bytes = encode_pool_info(pool_info)
+        pool_info_bytes = pool.get_encoded_info()
+        info_hash = hashlib.sha256(pool_info_bytes).hexdigest()
+
+        # A matching local hash means the exact same bytes were already
+        # published by this hotkey, so the chain read can be skipped
+        cached = self.storage.load_data(
+            key=wallet.hotkey.ss58_address, prefix="pool_info_hash"
+        )
+        if cached and cached.get("hash") == info_hash:
+            logging.success("Pool info unchanged (local hash match).")
+            return
 
         published_pool_info = get_pool_info(
             subtensor, netuid, wallet.hotkey.ss58_address
         )
         if published_pool_info is not None:
             logging.info("Pool info detected.")
-            published_pool_info_bytes = encode_pool_info(published_pool_info)
-            if published_pool_info_bytes == pool_info_bytes:
+            # Field-level compare of the encoded payload; cheaper than
+            # re-encoding the decoded chain data just to diff bytes
+            if published_pool_info.to_raw() == pool.get_pool_info().to_raw():
                 logging.success("Pool info is already published.")
+                self._save_pool_info_hash(wallet, info_hash)
                 return
             else:
                 logging.info("Pool info is outdated.")
 
         logging.info("Publishing pool info to the chain.")
-        success = publish_pool_info(subtensor, netuid, wallet, pool_info_bytes)
-        if not success:
-            logging.error("Failed to publish pool info")
-            exit(1)
-        else:
-            logging.success("Pool info published successfully")
+        # Retry with backoff before exiting: a full process restart costs far
+        # more than waiting out a transient chain hiccup
+        max_attempts = 5
+        for attempt in range(max_attempts):
+            try:
+                success = publish_pool_info(subtensor, netuid, wallet, pool_info_bytes)
+            except Exception as e:
+                success = False
+                logging.warning(f"Publish attempt {attempt + 1} raised: {e}")
+            if success:
+                logging.success("Pool info published successfully")
+                self._save_pool_info_hash(wallet, info_hash)
+                return
+            wait_time = 2**attempt
+            logging.warning(
+                f"Failed to publish pool info (attempt {attempt + 1}/{max_attempts}). "
+                f"Retrying in {wait_time}s."
+            )
+            time.sleep(wait_time)
+
+        logging.error(f"Failed to publish pool info after {max_attempts} attempts")
+        exit(1)
+
+    def _save_pool_info_hash(self, wallet: "Wallet", info_hash: str) -> None:
+        """Persist the hash of the published pool info for startup short-circuits."""
+        self.storage.save_data(
+            key=wallet.hotkey.ss58_address,
+            data={"hash": info_hash},
+            prefix="pool_info_hash",
+        )
 
     def evaluate_miner_share_value(self) -> None:
         """
@@ -148,114 +277,150 @@ class TaohashProxyValidator(BaseValidator):
             2. Fetch miner contributions from proxy for that time range
             3. Update scores for each miner based on share values
         """
-        hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(self.hotkeys)}
-
         current_time = int(time.time())
 
-        for coin in self.config.coins:
-            pool = self.pools.get(coin)
-            if pool is None:
-                logging.warning(
-                    f"No proxy pool configured for {coin}. Skipping evaluation."
-                )
-                continue
-
-            evaluation_metrics = self.evaluation_metrics[coin]
-            coin_last_eval = evaluation_metrics.last_evaluation_timestamp
-            if coin_last_eval:
-                start_time = coin_last_eval
-                end_time = current_time
+        if len(self.config.coins) == 1:
+            self._evaluate_coin(self.config.coins[0], current_time)
+            return
 
-                max_range = 24 * 60 * 60
-                if end_time - start_time > max_range:
-                    start_time = end_time - max_range
+        # Each coin talks to its own proxy endpoint, so the fetches overlap
+        futures = [
+            self._eval_executor.submit(self._evaluate_coin, coin, current_time)
+            for coin in self.config.coins
+        ]
+        for future in futures:
+            future.result()
+
+    def _evaluate_coin(self, coin: str, current_time: int) -> None:
+        """Fetch and score one coin's miner contributions."""
+        pool = self.pools.get(coin)
+        if pool is None:
+            logging.warning(f"No proxy pool configured for {coin}. Skipping evaluation.")
+            return
 
-                logging.info(
-                    f"Evaluating {coin.upper()} miners for time range: {start_time} to {end_time} ({end_time - start_time} seconds)"
-                )
-            else:
-                end_time = current_time
-                start_time = end_time - (10 * 60)
-                logging.info(
-                    f"First evaluation for {coin.upper()} - using last 10 minutes: {start_time} to {end_time}"
-                )
+        evaluation_metrics = self.evaluation_metrics[coin]
+        coin_last_eval = evaluation_metrics.last_evaluation_timestamp
+        if coin_last_eval:
+            start_time = coin_last_eval
+            end_time = current_time
 
-            try:
-                timerange_result = get_metrics_timerange(
-                    pool,
-                    self.hotkeys,
-                    self.block_at_registration,
-                    start_time,
-                    end_time,
-                    coin,
-                )
+            max_range = 24 * 60 * 60
+            if end_time - start_time > max_range:
+                start_time = end_time - max_range
 
-                miner_metrics: list[ProxyMetrics] = timerange_result["metrics"]
-                payout_factor = timerange_result["payout_factor"]
+            logging.info(
+                f"Evaluating {coin.upper()} miners for time range: {start_time} to {end_time} ({end_time - start_time} seconds)"
+            )
+        else:
+            end_time = current_time
+            start_time = end_time - (10 * 60)
+            logging.info(
+                f"First evaluation for {coin.upper()} - using last 10 minutes: {start_time} to {end_time}"
+            )
 
-                evaluation_metrics.payout_factor = (
-                    payout_factor
-                    if payout_factor <= 1
-                    else evaluation_metrics.payout_factor
-                )
+        try:
+            timerange_result = get_metrics_timerange_arrays(
+                pool,
+                self.hotkeys,
+                self.block_at_registration,
+                start_time,
+                end_time,
+                coin,
+                hotkeys_to_workers=self._hotkeys_to_workers,
+            )
 
-                coin_price = self.price_api.get_price(coin)
-                coin_difficulty = get_current_difficulty(coin)
+            uids = timerange_result["uids"]
+            raw_share_values = timerange_result["share_values"]
+            payout_factor = timerange_result["payout_factor"]
 
-                share_rows = []
-                for metric in miner_metrics:
-                    if metric.hotkey not in hotkey_to_uid:
-                        continue
+            if uids.size == 0:
+                # Leave the timestamp untouched so the next evaluation
+                # covers this window too instead of dropping it
+                logging.info(
+                    f"No {coin.upper()} miner contributions for time range "
+                    f"{start_time} to {end_time}. Keeping evaluation timestamp."
+                )
+                return
 
-                    uid = hotkey_to_uid[metric.hotkey]
-                    share_value = metric.get_share_value_fiat(
-                        coin_price, coin_difficulty, coin
-                    )
+            evaluation_metrics.payout_factor = (
+                payout_factor
+                if payout_factor <= 1
+                else evaluation_metrics.payout_factor
+            )
 
-                    evaluation_metrics.add_score(uid, share_value)
-                    if share_value > 0:
-                        share_rows.append(
-                            [
-                                uid,
-                                metric.hotkey,
-                                f"{share_value:.8f}",
-                            ]
-                        )
+            coin_price = self.price_api.get_price(coin)
+            coin_difficulty = get_current_difficulty(coin)
 
+            share_values = share_values_to_fiat(
+                raw_share_values, coin_price, coin_difficulty, coin
+            )
+            evaluation_metrics.add_scores(uids, share_values)
+
+            # Row formatting is log-only work; skip it when nothing will print
+            if logging.isEnabledFor(std_logging.INFO):
+                share_rows = [
+                    [uid, self.hotkeys[uid], f"{share_value:.8f}"]
+                    for uid, share_value in zip(uids.tolist(), share_values.tolist())
+                    if share_value > 0
+                ]
                 self._log_evaluation_for_coin(
                     coin, share_rows, timeframe_seconds=end_time - start_time
                 )
 
-                evaluation_metrics.last_evaluation_timestamp = current_time
-                logging.info(
-                    f"Updated {coin.upper()} evaluation timestamp to {current_time}"
-                )
+            evaluation_metrics.last_evaluation_timestamp = current_time
+            logging.info(
+                f"Updated {coin.upper()} evaluation timestamp to {current_time}"
+            )
+
+        except Exception as e:
+            logging.error(
+                f"Failed to retrieve {coin.upper()} miner metrics for time range {start_time} to {end_time}: {e}. "
+                f"Keeping {coin.upper()} timestamp {coin_last_eval if coin_last_eval else ''}"
+            )
 
+    def _prefetch_pricing(self, next_sync_block: int) -> None:
+        """
+        Warm the price and difficulty TTL caches shortly before the next sync.
+
+        Runs on the I/O executor while the main loop is blocked in
+        wait_for_block; sleeps until ~30s before the target block so the
+        cached values are still fresh when evaluation needs them.
+        """
+        wait_seconds = (next_sync_block - self.current_block) * BLOCK_TIME - 30
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        try:
+            # One batched request warms the cache for every coin at once
+            self.price_api.get_prices(list(self.config.coins))
+        except Exception as e:
+            logging.debug(f"Price prefetch failed: {e}")
+        for coin in self.config.coins:
+            try:
+                get_current_difficulty(coin)
             except Exception as e:
-                logging.error(
-                    f"Failed to retrieve {coin.upper()} miner metrics for time range {start_time} to {end_time}: {e}. "
-                    f"Keeping {coin.upper()} timestamp {coin_last_eval if coin_last_eval else ''}"
-                )
+                logging.debug(f"Difficulty prefetch for {coin} failed: {e}")
 
-    def _log_final_scores(self, final_scores: list[float]) -> None:
+    def _log_final_scores(self, final_scores: np.ndarray) -> None:
         """Log current scores based on merged scores from evaluated coins."""
+        if not logging.isEnabledFor(std_logging.INFO):
+            return
+
         rows = []
         headers = ["UID", "Hotkey", "Final Score"]
 
-        sorted_indices = sorted(
-            range(len(final_scores)), key=lambda s: final_scores[s], reverse=True
-        )
-
-        for i in sorted_indices:
-            if final_scores[i] > 0:
-                hotkey = self.metagraph.hotkeys[i]
-                rows.append(
-                    [
-                        i,
-                        f"{hotkey}",
-                        f"{final_scores[i]:.8f}",
-                    ]
-                )
+        # Sort only the active miners rather than the whole metagraph
+        active = np.flatnonzero(final_scores > 0)
+        sorted_indices = active[np.argsort(-final_scores[active])]
+
+        for i in sorted_indices.tolist():
+            hotkey = self.metagraph.hotkeys[i]
+            rows.append(
+                [
+                    i,
+                    f"{hotkey}",
+                    f"{final_scores[i]:.8f}",
+                ]
+            )
 
         if not rows:
             logging.info(
@@ -263,9 +428,7 @@ class TaohashProxyValidator(BaseValidator):
             )
             return
 
-        table = tabulate(
-            rows, headers=headers, tablefmt="grid", numalign="right", stralign="left"
-        )
+        table = self._format_table(rows, headers, tablefmt="grid")
 
         title = f"Current Mining Scores - Block {self.current_block} - Coins: {self.config.coins}"
         logging.info(f"Scores updated at block {self.current_block}")
@@ -279,12 +442,15 @@ class TaohashProxyValidator(BaseValidator):
         }
         state = {
             "evaluation_metrics": evaluation_metrics_data,
-            "hotkeys": self.hotkeys,
-            "block_at_registration": self.block_at_registration,
+            "moving_avg_scores": self.moving_avg_scores.tolist(),
+            "hotkeys": list(self.hotkeys),
+            "block_at_registration": list(self.block_at_registration),
             "current_block": self.current_block,
         }
-        self.storage.save_state(state)
-        logging.info(f"Saved validator state at block {self.current_block}")
+        # The snapshot above copies everything mutable, so the write can run
+        # in the background without blocking the next wait_for_block
+        self._save_executor.submit(self.storage.save_state, state)
+        logging.info(f"Saving validator state at block {self.current_block}")
 
     def restore_state_and_evaluate(self) -> None:
         """
@@ -323,29 +489,48 @@ class TaohashProxyValidator(BaseValidator):
         else:
             self.setup_evaluation_metrics(total_hotkeys)
 
-        self.resync_metagraph()
+        # Restore the smoothed scores so a restart doesn't reset the EMA and
+        # under-reward miners until it converges again
+        saved_ema = np.asarray(state.get("moving_avg_scores", []), dtype=np.float64)
+        if saved_ema.size:
+            if saved_ema.size < total_hotkeys:
+                saved_ema = np.pad(saved_ema, (0, total_hotkeys - saved_ema.size))
+            self.moving_avg_scores = saved_ema
+
+        # The metagraph was fetched moments ago in setup; if the saved state
+        # is at most a block old and the hotkeys line up, a full resync can't
+        # tell us anything new
+        if blocks_down <= 1 and self.hotkeys == self.metagraph.hotkeys:
+            logging.debug("State is fresh, skipping metagraph resync")
+        else:
+            self.resync_metagraph()
 
-        for idx in range(len(self.hotkeys)):
-            # If the coldkey is a bad one, reset scores to 0 for all coins
-            if self.metagraph.coldkeys[idx] in BAD_COLDKEYS:
-                for metrics in self.evaluation_metrics.values():
-                    metrics.scores[idx] = 0.0
+        # If a coldkey is a bad one, reset its scores to 0 for all coins
+        bad_mask = np.fromiter(
+            (coldkey in BAD_COLDKEYS for coldkey in self.metagraph.coldkeys),
+            dtype=bool,
+            count=len(self.metagraph.coldkeys),
+        )
+        if bad_mask.any():
+            for metrics in self.evaluation_metrics.values():
+                metrics.scores[bad_mask[: metrics.scores.size]] = 0.0
+            self.moving_avg_scores[bad_mask[: self.moving_avg_scores.size]] = 0.0
 
         logging.warning(f"Validator was down for {blocks_down} blocks.")
         self.evaluate_miner_share_value()
 
         logging.success("Successfully restored validator state")
 
-    def calculate_weights_distribution(self, final_scores: list[float]) -> list[float]:
-        weights = [0.0] * len(self.hotkeys)
-        total_value = sum(final_scores)
+    def calculate_weights_distribution(
+        self, final_scores: np.ndarray, total_value: float
+    ) -> np.ndarray:
 
         tao_price = self.price_api.get_price("bittensor")
         subnet_price = self.subtensor.subnet(self.config.netuid).price.tao
         alpha_price = subnet_price * tao_price
 
         blocks_to_set_for = self.current_block - self.last_update
-        alpha_to_dist = blocks_to_set_for * (1 - OWNER_TAKE) * SPLIT_WITH_MINERS
+        alpha_to_dist = blocks_to_set_for * _MINER_SHARE
         value_to_dist = alpha_to_dist * alpha_price
 
         payout_factors = {
@@ -354,20 +539,26 @@ class TaohashProxyValidator(BaseValidator):
         }
         logging.info(f"Payout factors: {payout_factors}")
 
+        weights = self._weight_buf
+        # Degenerate distributions (no value to distribute, or pricing
+        # returned garbage) would divide by ~0 below; burn everything instead
+        if total_value <= 0 or value_to_dist <= 0 or not np.isfinite(value_to_dist):
+            weights.fill(0.0)
+            weights[self.burn_uid] = 1.0
+            return weights
+
         if total_value > value_to_dist:
-            weights = [score / total_value for score in final_scores]
+            np.divide(final_scores, total_value, out=weights)
         else:
             weights_to_dist = total_value / value_to_dist
-            weights = [
-                (score / total_value) * weights_to_dist for score in final_scores
-            ]
+            np.multiply(final_scores, weights_to_dist / total_value, out=weights)
 
-        sum_weights = sum(weights)
+        sum_weights = float(weights.sum())
         remaining = max(0.0, 1.0 - sum_weights)
         if remaining > 0:
             weights[self.burn_uid] += remaining
         elif sum_weights > 1.0:
-            weights = [w / sum_weights for w in weights]
+            weights /= sum_weights
         return weights
 
     def set_weights(self) -> tuple[bool, str]:
@@ -380,34 +571,47 @@ class TaohashProxyValidator(BaseValidator):
 
         Evaluation:
             1. Apply payout factor & consolidate scores from all coins.
-            2. Calculate weights based on the consolidated scores.
-            3. Ensure miners are still active - otherwise burn the alpha.
-            4. Reset scores for next cycle.
+            2. Smooth scores with an asymmetric EMA (fast rise, slow decay).
+            3. Calculate weights based on the smoothed scores.
+            4. Ensure miners are still active - otherwise burn the alpha.
+            5. Reset scores for next cycle.
         """
         # Apply payout factor + consolidate
-        final_scores = [0.0] * len(self.hotkeys)
+        cycle_scores = np.zeros(len(self.hotkeys), dtype=np.float64)
         for metrics in self.evaluation_metrics.values():
-            weighted_scores = metrics.get_weighted_scores()
-            for uid in range(len(self.hotkeys)):
-                final_scores[uid] += weighted_scores[uid]
+            cycle_scores += metrics.get_weighted_scores()
+
+        # Asymmetric EMA: rise with positive_alpha, decay with negative_alpha
+        alpha = np.where(
+            cycle_scores > self.moving_avg_scores,
+            self.positive_alpha,
+            self.negative_alpha,
+        )
+        self.moving_avg_scores = (
+            alpha * cycle_scores + (1 - alpha) * self.moving_avg_scores
+        )
+        final_scores = self.moving_avg_scores
 
         self._log_final_scores(final_scores)
 
         # Calculate weights
-        total_value = sum(final_scores)
+        total_value = float(final_scores.sum())
         if total_value == 0:
             logging.info("No miners are mining, we should burn the alpha")
-            weights = [0.0] * len(self.hotkeys)
-            weights[self.burn_uid] = 1.0
+            self._weight_buf.fill(0.0)
+            self._weight_buf[self.burn_uid] = 1.0
+            weights = self._weight_buf.tolist()
         else:
-            weights = self.calculate_weights_distribution(final_scores)
+            weights = self.calculate_weights_distribution(
+                final_scores, total_value
+            ).tolist()
 
         logging.info("Setting weights")
 
         success, err_msg = self.subtensor.set_weights(
             netuid=self.config.netuid,
             wallet=self.wallet,
-            uids=list(range(len(self.hotkeys))),
+            uids=self._uids,
             weights=weights,
             wait_for_inclusion=True,
             version_key=VERSION_KEY,
@@ -445,47 +649,95 @@ class TaohashProxyValidator(BaseValidator):
         next_sync_block = self.current_block + self.eval_interval
         logging.info(f"Next sync at block {next_sync_block}")
 
+        consecutive_errors = 0
         while True:
             try:
+                if self._prefetch_future is None or self._prefetch_future.done():
+                    self._prefetch_future = self._io_executor.submit(
+                        self._prefetch_pricing, next_sync_block
+                    )
                 if self.subtensor.wait_for_block(next_sync_block):
                     self.resync_metagraph()
 
+                    # Once we've set weights ourselves, last_update tracks the
+                    # chain and the RPC is redundant; before that, fetch it
+                    # concurrently — evaluation only talks to the proxy and
+                    # pricing APIs, so the chain round-trip hides behind the
+                    # HTTP fetches. The chain executor's single worker and
+                    # dedicated connection keep these queries from ever racing
+                    # each other or the main thread's subtensor calls.
+                    blocks_future = (
+                        None
+                        if self.last_update
+                        else self._chain_executor.submit(
+                            self._chain_subtensor.blocks_since_last_update,
+                            self.config.netuid,
+                            self.uid,
+                        )
+                    )
+                    # The trust query exists only for the end-of-cycle log
+                    # line; fire it alongside the blocks query (skipping the
+                    # RPC entirely when INFO logging is off)
+                    vtrust_future = (
+                        self._chain_executor.submit(
+                            self._chain_subtensor.query_subtensor,
+                            "ValidatorTrust",
+                            params=[self.config.netuid],
+                        )
+                        if logging.isEnabledFor(std_logging.INFO)
+                        else None
+                    )
                     self.evaluate_miner_share_value()
 
-                    blocks_since_last_weights = self.subtensor.blocks_since_last_update(
-                        self.config.netuid, self.uid
+                    blocks_since_last_weights = (
+                        self.current_block - self.last_update
+                        if blocks_future is None
+                        else blocks_future.result()
                     )
                     if blocks_since_last_weights >= self.weights_interval:
                         success, err_msg = self.set_weights()
                         if not success:
                             logging.error(f"Failed to set weights: {err_msg}")
                             continue
+                        # Weights were just included; no need to re-query
+                        blocks_since_last_weights = 0
 
                     self.save_state()
-                    validator_trust = self.subtensor.query_subtensor(
-                        "ValidatorTrust",
-                        params=[self.config.netuid],
-                    )
-                    normalized_validator_trust = (
-                        validator_trust[self.uid] / U16_MAX
-                        if validator_trust[self.uid] > 0
-                        else 0
-                    )
 
-                    next_sync_block, sync_reason = self.get_next_sync_block()
-                    logging.info(
-                        f"Block: {self.current_block} | "
-                        f"Next sync: {next_sync_block} | "
-                        f"Sync reason: {sync_reason} | "
-                        f"VTrust: {normalized_validator_trust:.2f}"
+                    next_sync_block, sync_reason = self.get_next_sync_block(
+                        blocks_since_last_weights
                     )
+                    if vtrust_future is not None:
+                        validator_trust = vtrust_future.result()
+                        normalized_validator_trust = (
+                            validator_trust[self.uid] / U16_MAX
+                            if validator_trust[self.uid] > 0
+                            else 0
+                        )
+                        logging.info(
+                            f"Block: {self.current_block} | "
+                            f"Next sync: {next_sync_block} | "
+                            f"Sync reason: {sync_reason} | "
+                            f"VTrust: {normalized_validator_trust:.2f}"
+                        )
+                    consecutive_errors = 0
                 else:
                     logging.warning("Timeout waiting for block, retrying...")
                     continue
 
             except RuntimeError as e:
-                logging.error(e)
-                traceback.print_exc()
+                logging.error(repr(e))
+                # Rate-limit full tracebacks so a flaky endpoint can't spam
+                # stderr on every loop iteration
+                if time.time() - self._last_traceback_time > 60:
+                    self._last_traceback_time = time.time()
+                    traceback.print_exc()
+                # Back off with jitter so a degraded endpoint isn't hammered
+                # on every failed iteration
+                consecutive_errors += 1
+                time.sleep(
+                    min(60, 2**consecutive_errors) + random.uniform(0, 1)
+                )
 
             except KeyboardInterrupt:
                 logging.success("Keyboard interrupt detected. Exiting validator.")
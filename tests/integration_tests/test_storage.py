@@ -1,4 +1,4 @@
-import time
+import pytest
 from taohash.miner.storage import JsonStorage, RedisStorage
 from bittensor.core.config import Config
 
@@ -11,12 +11,18 @@ example_pool_data = {
         "extra_data": {"full_username": "user.workerid"}
     }
 }
-example_block = int(time.time())
 
 
-def test_storage_json():
+@pytest.fixture
+def example_block() -> int:
+    """Deterministic block height so re-runs hit the same storage key."""
+    return 1_700_000_000
+
+
+def test_storage_json(tmp_path, example_block):
     """Tests JSON storage."""
     config = Config()
+    config.json_path = str(tmp_path)
     json_store = JsonStorage(config)
     json_store.save_pool_data(example_block, example_pool_data)
 
@@ -29,7 +35,7 @@ def test_storage_json():
     assert latest == example_pool_data
 
 
-def test_storage_redis():
+def test_storage_redis(example_block):
     """Tests Redis storage."""
     try:
         import redis
@@ -4,7 +4,7 @@ import responses
 
 from taohash.core.pricing.coingecko import CoinGeckoAPI
 from taohash.core.pricing.coinmarketcap import CoinMarketCapAPI
-from taohash.core.pricing.price import UnitCoinPriceAPI
+from taohash.core.pricing.price import UnitCoinPriceAPI, _price_cache
 
 # Test data
 MOCK_COINGECKO_RESPONSE = {
@@ -36,6 +36,8 @@ class TestUnitPriceAPI:
 # CoinGecko Free API Tests
 class TestCoinGeckoAPI:
     def setup_method(self):
+        # The price cache is shared across API instances; isolate each test
+        _price_cache.clear()
         self.api = CoinGeckoAPI(api_key=None)
 
     @responses.activate
@@ -97,6 +99,8 @@ class TestCoinGeckoAPI:
 # CoinMarketCap API Tests
 class TestCoinMarketCapAPI:
     def setup_method(self):
+        # The price cache is shared across API instances; isolate each test
+        _price_cache.clear()
         self.api = CoinMarketCapAPI(api_key="test_key")
 
     @responses.activate